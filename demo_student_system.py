@@ -4,121 +4,149 @@ Demo script for Student Management System
 This script demonstrates all features with sample data.
 """
 
-from student_management_system import StudentManagementSystem
-import time
+from student_management_system import (
+    GRADE_LABELS, StudentManagementSystem, StudentTable, format_marks, grade_histogram
+)
+import argparse
+import asyncio
+import logging
+import sys
 
-def demonstrate_system():
+log = logging.getLogger('sms.demo')
+
+# Bound format method for table rows, parsed once instead of per row
+_ROW_FMT = "{0:<10} {1:<20} {2:<5} {3:<8} {4:<5}".format
+
+# Grade distribution bar drawn per student
+_BAR_UNIT = "█" * 2
+
+# Sample students (roll number, name, age, marks), typed and immutable
+_SAMPLE_STUDENTS = (
+    ("CS001", "Alice Johnson", 20, 95.0),
+    ("CS002", "Bob Smith", 19, 87.0),
+    ("CS003", "Charlie Brown", 21, 78.0),
+    ("CS004", "Diana Prince", 20, 92.0),
+    ("CS005", "Eve Wilson", 19, 69.0),
+)
+
+async def demonstrate_system(pace: float = 0.0) -> None:
     """Demonstrate all features of the Student Management System."""
-    print("🎓 STUDENT MANAGEMENT SYSTEM DEMO")
-    print("=" * 50)
+    async def pause(seconds: float) -> None:
+        if pace:
+            await asyncio.sleep(seconds * pace)
+    
+    log.info("🎓 STUDENT MANAGEMENT SYSTEM DEMO")
+    log.info("=" * 50)
     
     # Create system instance
     sms = StudentManagementSystem("demo_students.csv")
     
     # Add some sample students
-    sample_students = [
-        {"roll_number": "CS001", "name": "Alice Johnson", "age": "20", "marks": "95"},
-        {"roll_number": "CS002", "name": "Bob Smith", "age": "19", "marks": "87"},
-        {"roll_number": "CS003", "name": "Charlie Brown", "age": "21", "marks": "78"},
-        {"roll_number": "CS004", "name": "Diana Prince", "age": "20", "marks": "92"},
-        {"roll_number": "CS005", "name": "Eve Wilson", "age": "19", "marks": "69"},
-    ]
+    log.info("\n📝 Adding sample students...")
+    tbl = StudentTable()
+    for student in _SAMPLE_STUDENTS:
+        tbl.append(*student)
+    sms.students = tbl.to_records()
+    log.info("✅ Added %d sample students!", len(_SAMPLE_STUDENTS))
     
-    print("\n📝 Adding sample students...")
-    sms.students = sample_students
-    sms.save_data()
-    print(f"✅ Added {len(sample_students)} sample students!")
+    # Index rows by roll number so lookups are a single hash probe
+    row_of = {roll_number: i for i, roll_number in enumerate(tbl.roll_numbers)}
     
-    time.sleep(2)
+    await pause(2)
     
     # Demonstrate view all with sorting
-    print("\n" + "="*60)
-    print("👥 VIEWING ALL STUDENTS (Sorted by Marks)")
-    print("="*60)
+    log.info("\n" + "="*60)
+    log.info("👥 VIEWING ALL STUDENTS (Sorted by Marks)")
+    log.info("="*60)
     
-    sorted_students = sorted(sms.students, key=lambda x: float(x['marks']), reverse=True)
-    print(f"{'Roll No':<10} {'Name':<20} {'Age':<5} {'Marks':<8} {'Grade':<5}")
-    print("-" * 50)
+    log.info(_ROW_FMT('Roll No', 'Name', 'Age', 'Marks', 'Grade'))
+    log.info("-" * 50)
     
-    for student in sorted_students:
-        marks = float(student['marks'])
-        grade = sms.calculate_grade(marks)
-        print(f"{student['roll_number']:<10} {student['name']:<20} {student['age']:<5} {student['marks']:<8} {grade:<5}")
+    # Build the whole table as one record, and only if it will be shown
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n".join(
+            _ROW_FMT(tbl.roll_numbers[i], tbl.names[i], tbl.ages[i],
+                     format_marks(tbl.marks[i]), sms.calculate_grade(tbl.marks[i]))
+            for i in tbl.order_by('marks', reverse=True)
+        ))
     
-    time.sleep(3)
+    await pause(3)
     
     # Demonstrate search
-    print("\n" + "="*50)
-    print("🔍 SEARCH DEMONSTRATION")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info("🔍 SEARCH DEMONSTRATION")
+    log.info("="*50)
     
-    print("Searching for 'Alice':")
-    found_students = []
-    for student in sms.students:
-        if "alice" in student['name'].lower():
-            found_students.append(student)
+    log.info("Searching for 'Alice':")
+    found_rows = tbl.find_name("alice")
     
-    if found_students:
-        for student in found_students:
-            marks = float(student['marks'])
-            grade = sms.calculate_grade(marks)
-            print(f"Found: {student['roll_number']} - {student['name']} ({student['marks']}% - Grade {grade})")
+    if found_rows:
+        for i in found_rows:
+            grade = sms.calculate_grade(tbl.marks[i])
+            log.info("Found: %s - %s (%s%% - Grade %s)",
+                     tbl.roll_numbers[i], tbl.names[i], format_marks(tbl.marks[i]), grade)
     
-    time.sleep(2)
+    await pause(2)
     
     # Demonstrate statistics
-    print("\n" + "="*50)
-    print("📊 SYSTEM STATISTICS")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info("📊 SYSTEM STATISTICS")
+    log.info("="*50)
     
-    total_students = len(sms.students)
-    marks_list = [float(student['marks']) for student in sms.students]
+    total_students = len(tbl)
     
-    avg_marks = sum(marks_list) / total_students
-    highest_marks = max(marks_list)
-    lowest_marks = min(marks_list)
+    avg_marks = sum(tbl.marks) / total_students
+    highest_marks = max(tbl.marks)
+    lowest_marks = min(tbl.marks)
     
-    # Grade distribution
-    grades = {'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-    for marks in marks_list:
-        grade = sms.calculate_grade(marks)
-        grades[grade] += 1
+    # Grade distribution, best grade first
+    counts = grade_histogram(tbl.marks)
+    grades = dict(zip(reversed(GRADE_LABELS), reversed(counts)))
     
-    print(f"📈 Total Students: {total_students}")
-    print(f"📈 Average Marks: {avg_marks:.2f}%")
-    print(f"📈 Highest Marks: {highest_marks}%")
-    print(f"📈 Lowest Marks: {lowest_marks}%")
+    log.info("📈 Total Students: %d", total_students)
+    log.info("📈 Average Marks: %.2f%%", avg_marks)
+    log.info("📈 Highest Marks: %s%%", highest_marks)
+    log.info("📈 Lowest Marks: %s%%", lowest_marks)
     
-    print(f"\n🎯 Grade Distribution:")
-    for grade, count in grades.items():
-        if count > 0:
-            percentage = (count / total_students) * 100
-            bar = "█" * (count * 2)  # Simple bar chart
-            print(f"{grade}: {count} students ({percentage:.1f}%) {bar}")
+    log.info("\n🎯 Grade Distribution:")
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n".join(
+            f"{grade}: {count} students ({count / total_students * 100:.1f}%) {_BAR_UNIT * count}"  # Simple bar chart
+            for grade, count in grades.items()
+            if count > 0
+        ))
     
-    time.sleep(3)
+    await pause(3)
     
     # Demonstrate update
-    print("\n" + "="*50)
-    print("✏️ UPDATE DEMONSTRATION")
-    print("="*50)
-    
-    print("Original record for CS003:")
-    for student in sms.students:
-        if student['roll_number'] == 'CS003':
-            print(f"Name: {student['name']}, Age: {student['age']}, Marks: {student['marks']}")
-            # Update marks
-            student['marks'] = '85'  # Improved marks
-            print(f"Updated marks to: {student['marks']}")
-            break
-    
-    time.sleep(2)
-    
-    # Final save
-    sms.save_data()
-    print("\n💾 Demo completed! All data saved to demo_students.csv")
-    print("\n🎓 You can now run the main system to explore these features interactively!")
+    log.info("\n" + "="*50)
+    log.info("✏️ UPDATE DEMONSTRATION")
+    log.info("="*50)
+    
+    log.info("Original record for CS003:")
+    row = row_of.get('CS003')
+    if row is not None:
+        log.info("Name: %s, Age: %d, Marks: %s", tbl.names[row], tbl.ages[row], format_marks(tbl.marks[row]))
+        # Update marks
+        tbl.marks[row] = 85.0  # Improved marks
+        log.info("Updated marks to: %s", format_marks(tbl.marks[row]))
+    
+    # Final save, written on a worker thread while the last pause runs
+    sms.students = tbl.to_records()
+    save = asyncio.get_running_loop().run_in_executor(None, sms.save_data)
+    await pause(2)
+    await save
+    log.info("\n💾 Demo completed! All data saved to demo_students.csv")
+    log.info("\n🎓 You can now run the main system to explore these features interactively!")
 
 
 if __name__ == "__main__":
-    demonstrate_system()
+    parser = argparse.ArgumentParser(description="Student Management System demo")
+    parser.add_argument('--pace', type=float, default=0.0,
+                        help="scale the pauses between sections (1.0 = original pacing)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="suppress the demo's own output")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    asyncio.run(demonstrate_system(args.pace))
@@ -17,13 +17,74 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import csv
 import os
-import json
-from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 
+from student_management_system import (
+    FIELDNAMES, GRADE_LABELS, GRADE_THRESHOLDS, IO_BUFFER_SIZE, calculate_grade, canonical_name
+)
+
+# How often the Tk thread checks whether a background write finished
+_POLL_MS = 50
+
+# Grade bounds as an array for bucketing marks in bulk
+_GRADE_BINS = np.array(GRADE_THRESHOLDS)
+
+# Table row tags (color coding) by grade
+_TAG_BY_GRADE = {
+    'A+': ('excellent',), 'A': ('excellent',),
+    'B+': ('good',), 'B': ('good',),
+    'C': ('average',),
+    'D': ('poor',), 'F': ('poor',)
+}
+
+
+def grade_indices(marks):
+    """Return the GRADE_LABELS index of each mark in an array; NaN grades as F."""
+    indices = np.searchsorted(_GRADE_BINS, marks, side='right')
+    indices[np.isnan(marks)] = 0
+    return indices
+
+
+def grade_counts(marks):
+    """Count an array of marks per grade, indexed like GRADE_LABELS."""
+    return np.bincount(grade_indices(marks), minlength=len(GRADE_LABELS))
+
+
+@lru_cache(maxsize=None)
+def io_pool():
+    """Return the single worker thread that runs file writes (saves and exports) in order."""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def read_csv_rows(filename):
+    """Return the header and rows of a CSV file."""
+    with open(filename, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        rows = [row for row in reader if row]
+    return header, rows
+
+
+def write_csv_rows(filename, header, rows):
+    """Write a CSV file; an empty list of rows leaves the file empty."""
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+        if rows:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+
+def after_future(widget, future, callback):
+    """Call callback(future) on the Tk thread once future has finished."""
+    if future.done():
+        callback(future)
+    else:
+        widget.after(_POLL_MS, after_future, widget, future, callback)
+
 
 class ModernStyle:
     """Modern color scheme and styling constants."""
@@ -61,13 +122,33 @@ class ModernStyle:
 class StudentGUI:
     """Main GUI application class."""
     
+    # Idle time after the last keystroke before the table is refreshed
+    SEARCH_DELAY_MS = 150
+    
+    # Rows given Treeview items up front; more are added in chunks of this
+    # size as the user scrolls towards the end of the table
+    RENDER_CHUNK = 200
+    
     def __init__(self):
         self.students = []
         self.filename = "students_gui.csv"
         self.theme = "light"
+        self._refresh_after_id = None
+        self._displayed = {}  # roll number (= Treeview item id) -> row values
+        self._filtered = []
+        self._render_limit = self.RENDER_CHUNK
+        self._charts_window = None
+        self._by_roll = {}  # roll number -> student record
+        self._dirty = False  # students changed since the last successful save
+        self._save_future = None  # last save handed to io_pool()
+        # NumPy columns parallel to self.students, see update_columns()
+        self._grade_idx = np.empty(0, dtype=np.uint8)
+        self._search_keys = np.empty(0, dtype=str)
+        self._last_search = ('', None)  # last search term and its matching rows
         self.setup_main_window()
-        self.load_data()
+        # Widgets first: load_data reports to the status bar
         self.create_widgets()
+        self.load_data()
         self.refresh_table()
         
     def setup_main_window(self):
@@ -297,18 +378,24 @@ class StudentGUI:
             self.tree.column(col, width=column_widths.get(col, 150), anchor='center')
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(table_frame, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll, xscrollcommand=h_scrollbar.set)
         
         # Pack table and scrollbars
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
         
+        # Configure row colors
+        self.tree.tag_configure('excellent', background='#E8F5E8')
+        self.tree.tag_configure('good', background='#E3F2FD')
+        self.tree.tag_configure('average', background='#FFF3E0')
+        self.tree.tag_configure('poor', background='#FFEBEE')
+        
         # Bind double-click event
         self.tree.bind('<Double-1>', self.on_item_double_click)
         
@@ -329,122 +416,167 @@ class StudentGUI:
         """Load student data from CSV file."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    self.students = list(reader)
+                # Pair each row with the header directly; DictReader does
+                # the same per row with extra bookkeeping
+                header, rows = read_csv_rows(self.filename)
+                self.students = [self.annotate_student(dict(zip(header, row))) for row in rows]
+                self._by_roll = {student['roll_number']: student for student in self.students}
+                self.update_columns()
                 self.update_status(f"Loaded {len(self.students)} students from {self.filename}")
             else:
                 self.update_status("No data file found. Starting with empty database.")
         except Exception as e:
             messagebox.showerror("Error", f"Error loading data: {e}")
             self.students = []
+            self._by_roll = {}
+            self.update_columns()
             
     def save_data(self):
-        """Save student data to CSV file."""
-        try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as file:
-                if self.students:
-                    fieldnames = ['roll_number', 'name', 'age', 'marks']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.students)
-            self.update_status("Data saved successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error saving data: {e}")
+        """Save student data to CSV file in the background, if it changed since the last save."""
+        if not self._dirty:
+            return
+        # Only the file's fields are written; cached '_' fields are not
+        # part of the format
+        rows = list(map(itemgetter(*FIELDNAMES), self.students))
+        self._dirty = False
+        self._save_future = io_pool().submit(write_csv_rows, self.filename, FIELDNAMES, rows)
+        after_future(self.root, self._save_future, self.on_saved)
+        
+    def on_saved(self, future):
+        """Report a background save that failed."""
+        error = future.exception()
+        if error is not None:
+            # Keep the changes pending so closing the app retries the save
+            self._dirty = True
+            messagebox.showerror("Error", f"Error saving data: {error}")
             
+    def annotate_student(self, student):
+        """Cache derived fields ('_marks_f', '_grade', '_name_lc', '_roll_lc', '_row') on a student record."""
+        student['_marks_f'] = float(student['marks'])
+        student['_grade'] = calculate_grade(student['_marks_f'])
+        student['_name_lc'] = student['name'].lower()
+        student['_roll_lc'] = student['roll_number'].lower()
+        student['_row'] = (
+            student['roll_number'],
+            student['name'],
+            student['age'],
+            student['marks'],
+            student['_grade']
+        )
+        return student
+        
+    def update_columns(self):
+        """Rebuild the NumPy grade and search columns after self.students changes."""
+        count = len(self.students)
+        marks = np.fromiter((s['_marks_f'] for s in self.students), dtype=np.float64, count=count)
+        self._grade_idx = grade_indices(marks).astype(np.uint8)
+        # Name and roll number joined by a newline, so a term can't match across both
+        self._search_keys = np.array([f"{s['_name_lc']}\n{s['_roll_lc']}" for s in self.students], dtype=str)
+        self._last_search = ('', None)
+        
+    def schedule_refresh(self):
+        """Refresh the table once input has been idle for SEARCH_DELAY_MS."""
+        self._render_limit = self.RENDER_CHUNK
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(self.SEARCH_DELAY_MS, self.refresh_table)
+        
     def refresh_table(self):
         """Refresh the data table."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # A refresh now makes any scheduled one redundant
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
             
-        # Get filtered students
-        filtered_students = self.get_filtered_students()
-        
-        # Add students to tree
-        for student in filtered_students:
-            marks = float(student['marks'])
-            grade = self.calculate_grade(marks)
-            
-            # Color coding based on grade
-            if grade in ['A+', 'A']:
-                tags = ('excellent',)
-            elif grade in ['B+', 'B']:
-                tags = ('good',)
-            elif grade == 'C':
-                tags = ('average',)
-            else:
-                tags = ('poor',)
-                
-            self.tree.insert('', 'end', values=(
-                student['roll_number'],
-                student['name'],
-                student['age'],
-                student['marks'],
-                grade
-            ), tags=tags)
-        
-        # Configure row colors
-        self.tree.tag_configure('excellent', background='#E8F5E8')
-        self.tree.tag_configure('good', background='#E3F2FD')
-        self.tree.tag_configure('average', background='#FFF3E0')
-        self.tree.tag_configure('poor', background='#FFEBEE')
+        self._filtered = self.get_filtered_students()
+        self.render_rows()
         
         # Update count
-        self.count_label.configure(text=f"Total: {len(filtered_students)} students")
+        self.count_label.configure(text=f"Total: {len(self._filtered)} students")
+        
+    def render_rows(self):
+        """Sync the Treeview with the first _render_limit filtered students."""
+        # Students to show, keyed by roll number, which is also the
+        # Treeview item id of their row
+        target = {student['roll_number']: student for student in self._filtered[:self._render_limit]}
+        
+        # Only touch rows that changed: drop rows that no longer match...
+        stale = [iid for iid in self._displayed if iid not in target]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._displayed[iid]
+        
+        # ...then insert missing rows and rewrite changed ones, appending at
+        # 'end' once every already displayed row has been passed
+        insert = self.tree.insert
+        displayed = self._displayed
+        remaining = len(displayed)
+        for index, (roll_number, student) in enumerate(target.items()):
+            tags = _TAG_BY_GRADE[student['_grade']]
+            values = student['_row']
+            shown = displayed.get(roll_number)
+            if shown is None:
+                insert('', index if remaining else 'end', iid=roll_number, values=values, tags=tags)
+            else:
+                remaining -= 1
+                if shown is not values and shown != values:
+                    self.tree.item(roll_number, values=values, tags=tags)
+            displayed[roll_number] = values
+            
+    def on_tree_scroll(self, first, last):
+        """Track the table's scroll position and render more rows near the end."""
+        self.v_scrollbar.set(first, last)
+        if float(last) >= 0.9 and self._render_limit < len(self._filtered):
+            self._render_limit += self.RENDER_CHUNK
+            self.render_rows()
         
     def get_filtered_students(self):
         """Get filtered list of students based on search and filter criteria."""
-        filtered = self.students.copy()
-        
-        # Apply search filter
         search_term = self.search_var.get().lower()
+        grade_filter = self.filter_var.get()
+        
+        # Apply search filter, then grade filter
         if search_term:
-            filtered = [
-                student for student in filtered
-                if (search_term in student['name'].lower() or
-                    search_term in student['roll_number'].lower())
-            ]
+            rows = self.search_rows(search_term)
+            if grade_filter != "All":
+                rows = rows[self._grade_idx[rows] == GRADE_LABELS.index(grade_filter)]
+        elif grade_filter != "All":
+            rows = np.flatnonzero(self._grade_idx == GRADE_LABELS.index(grade_filter))
+        else:
+            return self.students.copy()
         
-        # Apply grade filter
-        grade_filter = self.filter_var.get()
-        if grade_filter != "All":
-            filtered = [
-                student for student in filtered
-                if self.calculate_grade(float(student['marks'])) == grade_filter
-            ]
-        
-        return filtered
-        
-    def calculate_grade(self, marks):
-        """Calculate grade based on marks."""
-        if marks >= 90:
-            return 'A+'
-        elif marks >= 80:
-            return 'A'
-        elif marks >= 70:
-            return 'B+'
-        elif marks >= 60:
-            return 'B'
-        elif marks >= 50:
-            return 'C'
-        elif marks >= 40:
-            return 'D'
+        students = self.students
+        return [students[row] for row in rows.tolist()]
+        
+    def search_rows(self, search_term):
+        """Return the indices of students whose name or roll number contains search_term."""
+        # A term extending the previous one only needs its matches rechecked
+        last_term, last_rows = self._last_search
+        if last_term and last_term in search_term:
+            rows = last_rows[np.char.find(self._search_keys[last_rows], search_term) >= 0]
         else:
-            return 'F'
+            rows = np.flatnonzero(np.char.find(self._search_keys, search_term) >= 0)
+        self._last_search = (search_term, rows)
+        return rows
             
     def add_student_dialog(self):
         """Open dialog to add new student."""
         dialog = StudentDialog(self.root, "Add Student")
         if dialog.result:
             # Check for duplicate roll number
-            if any(s['roll_number'] == dialog.result['roll_number'] for s in self.students):
+            if dialog.result['roll_number'] in self._by_roll:
                 messagebox.showerror("Error", "Roll number already exists!")
                 return
                 
-            self.students.append(dialog.result)
+            student = self.annotate_student(dialog.result)
+            self.students.append(student)
+            self._by_roll[student['roll_number']] = student
+            self.update_columns()
+            self._dirty = True
             self.save_data()
             self.refresh_table()
+            self.refresh_charts()
             self.update_status(f"Added student: {dialog.result['name']}")
             
     def edit_student_dialog(self):
@@ -454,21 +586,33 @@ class StudentGUI:
             messagebox.showwarning("Warning", "Please select a student to edit.")
             return
             
-        item = self.tree.item(selection[0])
-        roll_number = item['values'][0]
+        # Item ids are roll numbers
+        roll_number = selection[0]
         
         # Find student data
-        student = next((s for s in self.students if s['roll_number'] == roll_number), None)
+        student = self._by_roll.get(roll_number)
         if not student:
             messagebox.showerror("Error", "Student not found!")
             return
             
         dialog = StudentDialog(self.root, "Edit Student", student)
         if dialog.result:
+            # Check for duplicate roll number
+            new_roll_number = dialog.result['roll_number']
+            if new_roll_number != roll_number and new_roll_number in self._by_roll:
+                messagebox.showerror("Error", "Roll number already exists!")
+                return
+                
             # Update student data
             student.update(dialog.result)
+            self.annotate_student(student)
+            del self._by_roll[roll_number]
+            self._by_roll[new_roll_number] = student
+            self.update_columns()
+            self._dirty = True
             self.save_data()
             self.refresh_table()
+            self.refresh_charts()
             self.update_status(f"Updated student: {dialog.result['name']}")
             
     def delete_student(self):
@@ -479,13 +623,16 @@ class StudentGUI:
             return
             
         item = self.tree.item(selection[0])
-        roll_number = item['values'][0]
+        roll_number = selection[0]
         name = item['values'][1]
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {name}?"):
-            self.students = [s for s in self.students if s['roll_number'] != roll_number]
+            self.students.remove(self._by_roll.pop(roll_number))
+            self.update_columns()
+            self._dirty = True
             self.save_data()
             self.refresh_table()
+            self.refresh_charts()
             self.update_status(f"Deleted student: {name}")
             
     def show_statistics(self):
@@ -502,7 +649,18 @@ class StudentGUI:
             messagebox.showinfo("Info", "No students to visualize!")
             return
             
-        ChartsWindow(self.root, self.students)
+        # Reuse an open charts window instead of building a new figure
+        if self.refresh_charts():
+            self._charts_window.window.lift()
+        else:
+            self._charts_window = ChartsWindow(self.root, self.students)
+            
+    def refresh_charts(self):
+        """Redraw the charts window for the current students; return False if none is open."""
+        if self._charts_window is None or not self._charts_window.window.winfo_exists():
+            return False
+        self._charts_window.refresh(self.students)
+        return True
         
     def export_data(self):
         """Export data to various formats."""
@@ -514,11 +672,11 @@ class StudentGUI:
         
     def on_search_change(self, *args):
         """Handle search text change."""
-        self.refresh_table()
+        self.schedule_refresh()
         
     def on_filter_change(self, event):
         """Handle filter selection change."""
-        self.refresh_table()
+        self.schedule_refresh()
         
     def on_item_double_click(self, event):
         """Handle double-click on table item."""
@@ -550,7 +708,15 @@ class StudentGUI:
         
     def on_closing(self):
         """Handle application closing."""
-        self.save_data()
+        # Let a save still running on the I/O thread finish, then save
+        # here if it failed or changes are still pending
+        if self._save_future is not None and self._save_future.exception() is not None:
+            self._dirty = True
+        if self._dirty:
+            try:
+                write_csv_rows(self.filename, FIELDNAMES, list(map(itemgetter(*FIELDNAMES), self.students)))
+            except Exception as e:
+                messagebox.showerror("Error", f"Error saving data: {e}")
         self.root.destroy()
 
 
@@ -678,7 +844,7 @@ class StudentDialog:
             # Save result
             self.result = {
                 'roll_number': roll_number,
-                'name': name.title(),
+                'name': canonical_name(name),
                 'age': str(age),
                 'marks': str(marks)
             }
@@ -721,17 +887,14 @@ class StatisticsWindow:
         
         # Calculate statistics
         total_students = len(self.students)
-        marks_list = [float(s['marks']) for s in self.students]
+        marks = np.fromiter((s['_marks_f'] for s in self.students), dtype=np.float64, count=total_students)
         
-        avg_marks = sum(marks_list) / total_students
-        highest_marks = max(marks_list)
-        lowest_marks = min(marks_list)
+        avg_marks = marks.mean()
+        highest_marks = marks.max()
+        lowest_marks = marks.min()
         
-        # Grade distribution
-        grades = {'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for marks in marks_list:
-            grade = self.calculate_grade(marks)
-            grades[grade] += 1
+        # Grade distribution, best grade first
+        grades = dict(zip(reversed(GRADE_LABELS), grade_counts(marks)[::-1].tolist()))
         
         # Display statistics
         stats = [
@@ -793,23 +956,6 @@ class StatisticsWindow:
                     bg=ModernStyle.COLORS['surface']
                 )
                 count_label.pack(side='right')
-        
-    def calculate_grade(self, marks):
-        """Calculate grade based on marks."""
-        if marks >= 90:
-            return 'A+'
-        elif marks >= 80:
-            return 'A'
-        elif marks >= 70:
-            return 'B+'
-        elif marks >= 60:
-            return 'B'
-        elif marks >= 50:
-            return 'C'
-        elif marks >= 40:
-            return 'D'
-        else:
-            return 'F'
 
 
 class ChartsWindow:
@@ -817,6 +963,13 @@ class ChartsWindow:
     
     def __init__(self, parent, students):
         self.students = students
+        self.fig = None
+        self.axes = None
+        self.canvas = None
+        # Artists updated in place by plot() after the first draw
+        self._hist_bars = None
+        self._scatter = None
+        self._perf_bars = None
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -829,60 +982,21 @@ class ChartsWindow:
     def create_charts(self):
         """Create charts display."""
         try:
-            # Create matplotlib figure
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle('Student Performance Analysis', fontsize=16)
-            
-            # Data preparation
-            marks_list = [float(s['marks']) for s in self.students]
-            ages = [int(s['age']) for s in self.students]
-            
-            # Grade distribution
-            grades = {'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-            for marks in marks_list:
-                grade = self.calculate_grade(marks)
-                grades[grade] += 1
-            
-            # Chart 1: Grade Distribution Pie Chart
-            grade_labels = list(grades.keys())
-            grade_counts = list(grades.values())
-            non_zero_grades = [(label, count) for label, count in zip(grade_labels, grade_counts) if count > 0]
+            # matplotlib is only loaded once charts are first opened, keeping
+            # it off the application's startup path
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
             
-            if non_zero_grades:
-                labels, counts = zip(*non_zero_grades)
-                ax1.pie(counts, labels=labels, autopct='%1.1f%%', startangle=90)
-                ax1.set_title('Grade Distribution')
-            
-            # Chart 2: Marks Distribution Histogram
-            ax2.hist(marks_list, bins=10, edgecolor='black', alpha=0.7)
-            ax2.set_title('Marks Distribution')
-            ax2.set_xlabel('Marks')
-            ax2.set_ylabel('Number of Students')
-            
-            # Chart 3: Age vs Marks Scatter Plot
-            ax3.scatter(ages, marks_list, alpha=0.6)
-            ax3.set_title('Age vs Marks')
-            ax3.set_xlabel('Age')
-            ax3.set_ylabel('Marks')
-            
-            # Chart 4: Performance Trends
-            sorted_students = sorted(self.students, key=lambda x: x['roll_number'])
-            roll_numbers = [s['roll_number'] for s in sorted_students[:10]]  # Show first 10
-            student_marks = [float(s['marks']) for s in sorted_students[:10]]
-            
-            ax4.bar(range(len(roll_numbers)), student_marks)
-            ax4.set_title('Individual Performance (First 10 Students)')
-            ax4.set_xlabel('Students')
-            ax4.set_ylabel('Marks')
-            ax4.set_xticks(range(len(roll_numbers)))
-            ax4.set_xticklabels(roll_numbers, rotation=45)
-            
-            plt.tight_layout()
+            # Create the figure once; refresh() redraws into the same axes.
+            # A bare Figure stays out of pyplot's global figure registry.
+            self.fig = Figure(figsize=(12, 8))
+            self.axes = self.fig.subplots(2, 2)
+            self.fig.suptitle('Student Performance Analysis', fontsize=16)
             
             # Embed plot in tkinter
-            canvas = FigureCanvasTkAgg(fig, self.window)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self.canvas = FigureCanvasTkAgg(self.fig, self.window)
+            self.plot()
+            self.canvas.get_tk_widget().pack(fill='both', expand=True)
             
         except ImportError:
             # Fallback if matplotlib is not available
@@ -893,29 +1007,94 @@ class ChartsWindow:
                 bg=ModernStyle.COLORS['background']
             )
             fallback_label.pack(expand=True)
-    
-    def calculate_grade(self, marks):
-        """Calculate grade based on marks."""
-        if marks >= 90:
-            return 'A+'
-        elif marks >= 80:
-            return 'A'
-        elif marks >= 70:
-            return 'B+'
-        elif marks >= 60:
-            return 'B'
-        elif marks >= 50:
-            return 'C'
-        elif marks >= 40:
-            return 'D'
+            
+    def refresh(self, students):
+        """Redraw the charts for an updated list of students."""
+        self.students = students
+        if self.canvas is not None:
+            self.plot()
+            
+    def plot(self):
+        """Draw the four charts, updating the existing artists after the first call."""
+        (ax1, ax2), (ax3, ax4) = self.axes
+        
+        # Data preparation
+        count = len(self.students)
+        marks = np.fromiter((s['_marks_f'] for s in self.students), dtype=np.float64, count=count)
+        ages = np.fromiter((int(s['age']) for s in self.students), dtype=np.int32, count=count)
+        
+        # Chart 1: Grade Distribution Pie Chart, best grade first. The
+        # number of wedges follows the data, so the pie is redrawn.
+        ax1.clear()
+        counts = grade_counts(marks)[::-1]
+        non_zero = counts > 0
+        
+        if non_zero.any():
+            labels = [label for label, shown in zip(reversed(GRADE_LABELS), non_zero) if shown]
+            ax1.pie(counts[non_zero], labels=labels, autopct='%1.1f%%', startangle=90)
+            ax1.set_title('Grade Distribution')
+        
+        # Chart 2: Marks Distribution Histogram (always 10 bins)
+        heights, edges = np.histogram(marks, bins=10)
+        widths = np.diff(edges)
+        if self._hist_bars is None:
+            self._hist_bars = ax2.bar(edges[:-1], heights, width=widths, align='edge', edgecolor='black', alpha=0.7)
+            ax2.set_title('Marks Distribution')
+            ax2.set_xlabel('Marks')
+            ax2.set_ylabel('Number of Students')
         else:
-            return 'F'
+            for bar, left, width, height in zip(self._hist_bars, edges[:-1], widths, heights):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(height)
+        ax2.relim()
+        ax2.autoscale_view()
+        
+        # Chart 3: Age vs Marks Scatter Plot
+        points = np.column_stack((ages, marks))
+        if self._scatter is None:
+            self._scatter = ax3.scatter(ages, marks, alpha=0.6)
+            ax3.set_title('Age vs Marks')
+            ax3.set_xlabel('Age')
+            ax3.set_ylabel('Marks')
+        else:
+            # relim() doesn't account for collections, so reset the data
+            # limits from the new points directly
+            self._scatter.set_offsets(points)
+            ax3.ignore_existing_data_limits = True
+            ax3.update_datalim(points)
+            ax3.autoscale_view()
+        
+        # Chart 4: Performance Trends
+        sorted_students = sorted(self.students, key=lambda x: x['roll_number'])
+        roll_numbers = [s['roll_number'] for s in sorted_students[:10]]  # Show first 10
+        student_marks = [s['_marks_f'] for s in sorted_students[:10]]
+        
+        if self._perf_bars is not None and len(self._perf_bars) == len(student_marks):
+            for bar, height in zip(self._perf_bars, student_marks):
+                bar.set_height(height)
+        else:
+            if self._perf_bars is None:
+                ax4.set_title('Individual Performance (First 10 Students)')
+                ax4.set_xlabel('Students')
+                ax4.set_ylabel('Marks')
+            else:
+                self._perf_bars.remove()
+            self._perf_bars = ax4.bar(range(len(roll_numbers)), student_marks, color='C0')
+        ax4.set_xticks(range(len(roll_numbers)))
+        ax4.set_xticklabels(roll_numbers, rotation=45)
+        ax4.relim()
+        ax4.autoscale_view()
+        
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
 
 
 class ExportDialog:
     """Dialog for exporting data."""
     
     def __init__(self, parent, students):
+        self.parent = parent
         self.students = students
         
         # Create dialog
@@ -971,22 +1150,18 @@ class ExportDialog:
         )
         
         if filename:
-            try:
-                with open(filename, 'w', newline='', encoding='utf-8') as file:
-                    fieldnames = ['roll_number', 'name', 'age', 'marks', 'grade']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for student in self.students:
-                        row = student.copy()
-                        row['grade'] = self.calculate_grade(float(student['marks']))
-                        writer.writerow(row)
-                
-                messagebox.showinfo("Success", f"Data exported successfully to {filename}")
-                self.dialog.destroy()
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+            # The cached '_row' tuples are immutable, so the worker can write them as is
+            rows = [student['_row'] for student in self.students]
+            future = io_pool().submit(self.write_csv, filename, rows)
+            after_future(self.parent, future, lambda done: self.on_exported(done, filename))
+            
+    @staticmethod
+    def write_csv(filename, rows):
+        """Write exported rows to a CSV file."""
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+            writer = csv.writer(file)
+            writer.writerow(list(FIELDNAMES) + ['grade'])
+            writer.writerows(rows)
     
     def export_json(self):
         """Export data as JSON."""
@@ -996,42 +1171,47 @@ class ExportDialog:
         )
         
         if filename:
-            try:
-                export_data = []
-                for student in self.students:
-                    student_data = student.copy()
-                    student_data['grade'] = self.calculate_grade(float(student['marks']))
-                    export_data.append(student_data)
-                
-                with open(filename, 'w', encoding='utf-8') as file:
-                    json.dump({
-                        'export_date': datetime.now().isoformat(),
-                        'total_students': len(self.students),
-                        'students': export_data
-                    }, file, indent=2, ensure_ascii=False)
+            # Only exports need datetime, so it is imported on first use
+            from datetime import datetime
+            
+            # As for CSV, hand the worker the cached row tuples
+            rows = [student['_row'] for student in self.students]
+            future = io_pool().submit(self.write_json, filename, datetime.now().isoformat(), rows)
+            after_future(self.parent, future, lambda done: self.on_exported(done, filename))
+            
+    @staticmethod
+    def write_json(filename, export_date, rows):
+        """Stream exported rows to a JSON file laid out like json.dump(..., indent=2)."""
+        import json
+        
+        keys = list(FIELDNAMES) + ['grade']
+        with open(filename, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+            file.write('{\n')
+            file.write(f'  "export_date": {json.dumps(export_date)},\n')
+            file.write(f'  "total_students": {len(rows)},\n')
+            if not rows:
+                file.write('  "students": []\n}')
+                return
                 
-                messagebox.showinfo("Success", f"Data exported successfully to {filename}")
+            file.write('  "students": [')
+            separator = '\n    '
+            for row in rows:
+                record = json.dumps(dict(zip(keys, row)), indent=2, ensure_ascii=False)
+                file.write(separator)
+                file.write(record.replace('\n', '\n    '))
+                separator = ',\n    '
+            file.write('\n  ]\n}')
+            
+    def on_exported(self, future, filename):
+        """Report the outcome of a background export."""
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("Success", f"Data exported successfully to {filename}")
+            # The user may have closed the dialog while the file was written
+            if self.dialog.winfo_exists():
                 self.dialog.destroy()
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
-    
-    def calculate_grade(self, marks):
-        """Calculate grade based on marks."""
-        if marks >= 90:
-            return 'A+'
-        elif marks >= 80:
-            return 'A'
-        elif marks >= 70:
-            return 'B+'
-        elif marks >= 60:
-            return 'B'
-        elif marks >= 50:
-            return 'C'
-        elif marks >= 40:
-            return 'D'
         else:
-            return 'F'
+            messagebox.showerror("Error", f"Export failed: {error}")
 
 
 def main():
@@ -13,7 +13,148 @@ Features:
 
 import csv
 import os
-from typing import List, Dict, Optional
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import itemgetter
+from typing import List, Dict, Iterable, Optional, Set
+
+FIELDNAMES = ('roll_number', 'name', 'age', 'marks')
+
+# Lowest mark of every grade above F, and the grade labels in the same
+# order: bisecting marks into GRADE_THRESHOLDS yields a GRADE_LABELS index
+GRADE_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+GRADE_LABELS = ('F', 'D', 'C', 'B', 'B+', 'A', 'A+')
+
+# Grade index of every whole mark 0-100. The thresholds are whole marks,
+# so truncating a fractional mark never changes its grade.
+_GRADE_LUT = bytes(bisect_right(GRADE_THRESHOLDS, mark) for mark in range(101))
+
+# Buffer size for CSV reads and writes; large enough that a typical
+# roster is transferred in a single system call
+IO_BUFFER_SIZE = 1 << 16
+
+# Student table layout used by the listing and search screens
+_TABLE_HEADER = f"{'Roll No':<10} {'Name':<20} {'Age':<5} {'Marks':<8} {'Grade':<5}"
+_TABLE_RULE = "-" * 50
+_ROW_FMT = "{0:<10} {1:<20} {2:<5} {3:<8} {4:<5}".format
+
+_MENU = "\n".join((
+    "",
+    "=" * 60,
+    "🎓 STUDENT MANAGEMENT SYSTEM",
+    "=" * 60,
+    "1. 📝 Add Student Record",
+    "2. 👥 View All Records",
+    "3. 🔍 Search Student Record",
+    "4. ✏️ Update Student Record",
+    "5. 🗑️ Delete Student Record",
+    "6. 📊 System Statistics",
+    "7. 💾 Save & Exit",
+    "=" * 60,
+    ""
+))
+
+
+def grade_index(marks: float) -> int:
+    """Return the GRADE_LABELS index for marks."""
+    if 0 <= marks <= 100:
+        return _GRADE_LUT[int(marks)]
+    if marks > 100:
+        return len(GRADE_THRESHOLDS)
+    # Negative marks, and NaN, which fails every comparison, grade as F
+    return 0
+
+
+def calculate_grade(marks: float) -> str:
+    """Calculate grade based on marks."""
+    return GRADE_LABELS[grade_index(marks)]
+
+
+def grade_histogram(marks: Iterable[float]) -> List[int]:
+    """Count marks per grade, indexed like GRADE_LABELS."""
+    codes = Counter(map(grade_index, marks))
+    return [codes[code] for code in range(len(GRADE_LABELS))]
+
+
+def format_marks(marks: float) -> str:
+    """Format marks the way they are stored, dropping a redundant '.0'."""
+    return str(int(marks)) if marks.is_integer() else str(marks)
+
+
+@lru_cache(maxsize=8192)
+def canonical_name(name: str) -> str:
+    """Return a name stripped, title-cased and interned."""
+    return sys.intern(name.strip().title())
+
+
+# Ages and marks come from a small set of distinct strings, so their
+# parses are memoized; a repeated entry costs one dict lookup
+@lru_cache(maxsize=1024)
+def validate_age(age_str: str) -> Optional[int]:
+    """Validate and return age as integer."""
+    try:
+        age = int(age_str)
+        if age < 1 or age > 150:
+            raise ValueError("Age must be between 1 and 150")
+        return age
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def validate_marks(marks_str: str) -> Optional[float]:
+    """Validate and return marks as float."""
+    try:
+        marks = float(marks_str)
+        if not 0 <= marks <= 100:
+            raise ValueError("Marks must be between 0 and 100")
+        return marks
+    except ValueError:
+        return None
+
+
+class StudentTable:
+    """Column-oriented copy of student records for bulk operations."""
+    
+    def __init__(self):
+        """Create an empty table with one column per student field."""
+        self.roll_numbers: List[str] = []
+        self.names: List[str] = []
+        self.names_lower: List[str] = []
+        self.ages: 'array[int]' = array('h')
+        self.marks: 'array[float]' = array('d')
+    
+    def append(self, roll_number: str, name: str, age: int, marks: float) -> None:
+        """Append one student whose numeric fields are already parsed."""
+        self.roll_numbers.append(roll_number)
+        self.names.append(name)
+        self.names_lower.append(name.lower())
+        self.ages.append(age)
+        self.marks.append(marks)
+    
+    def __len__(self) -> int:
+        return len(self.roll_numbers)
+    
+    def order_by(self, column: str, reverse: bool = False) -> List[int]:
+        """Return row indices sorted by a column."""
+        values = getattr(self, column)
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    
+    def find_name(self, term: str) -> List[int]:
+        """Return indices of rows whose name contains term, ignoring case."""
+        matches = map(str.__contains__, self.names_lower, repeat(term.lower()))
+        return list(compress(range(len(self.names_lower)), matches))
+    
+    def to_records(self) -> List[Dict[str, str]]:
+        """Convert back to the string-valued dicts used for CSV storage."""
+        return [
+            {'roll_number': roll_number, 'name': name, 'age': str(age), 'marks': format_marks(marks)}
+            for roll_number, name, age, marks in zip(self.roll_numbers, self.names, self.ages, self.marks)
+        ]
 
 
 class StudentManagementSystem:
@@ -22,59 +163,127 @@ class StudentManagementSystem:
     def __init__(self, filename: str = "students.csv"):
         """Initialize the system with a data file."""
         self.filename = filename
-        self.students: List[Dict[str, str]] = []
+        self.students = []
+        # Whether the data file's header is FIELDNAMES, so rows can be appended to it
+        self._header_matches = True
         self.load_data()
     
+    @property
+    def students(self) -> List[Dict[str, str]]:
+        """All student records, in file order."""
+        return self._students
+    
+    @students.setter
+    def students(self, students: List[Dict[str, str]]) -> None:
+        """Replace the records, caching parsed marks and rebuilding the roll number index."""
+        for student in students:
+            self.annotate_student(student)
+        self._students = students
+        # Index the first record of each roll number, as the linear
+        # scans in update/delete would find it
+        self._by_roll: Dict[str, Dict[str, str]] = {
+            student['roll_number']: student for student in reversed(students)
+        }
+        self.records_changed()
+    
+    def records_changed(self) -> None:
+        """Drop the caches derived from the records after any add, edit or delete."""
+        self._trigrams: Optional[Dict[str, Set[int]]] = None
+        self._columns: Dict[str, List] = {}
+    
+    def column(self, field: str) -> List:
+        """Return one field of every record, cached until the records change."""
+        values = self._columns.get(field)
+        if values is None:
+            values = list(map(itemgetter(field), self.students))
+            if field == '_marks_f':
+                values = array('d', values)
+            self._columns[field] = values
+        return values
+    
+    def order_by(self, field: str, reverse: bool = False) -> List[int]:
+        """Return record indices sorted by a field."""
+        values = self.column(field)
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    
+    def annotate_student(self, student: Dict[str, str]) -> Dict[str, str]:
+        """Cache a record's parsed marks as '_marks_f' and lowercased name as '_name_lc'."""
+        # A malformed record is left uncached rather than failing the whole load
+        try:
+            student['_name_lc'] = (student.get('name') or '').lower()
+            student['_marks_f'] = float(student['marks'])
+        except (KeyError, AttributeError, TypeError, ValueError):
+            pass
+        return student
+    
     def load_data(self) -> None:
         """Load student data from CSV file."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    self.students = list(reader)
+                with open(self.filename, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                    # Rows zipped onto the header; like DictReader, blank lines are
+                    # skipped and short rows padded with None
+                    reader = csv.reader(file)
+                    header = next(reader, None)
+                    self.students = [
+                        dict(zip(header, row + [None] * (len(header) - len(row)))) for row in reader if row
+                    ]
+                self._header_matches = header is None or tuple(header) == FIELDNAMES
                 print(f"✅ Loaded {len(self.students)} student records from {self.filename}")
             else:
                 print(f"📁 No existing data file found. Starting with empty database.")
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             self.students = []
+            self._header_matches = False
     
     def save_data(self) -> None:
-        """Save student data to CSV file."""
+        """Save student data to CSV file, replacing it atomically via a temporary file."""
+        temp_filename = self.filename + '.tmp'
         try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as file:
+            with open(temp_filename, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
                 if self.students:
-                    fieldnames = ['roll_number', 'name', 'age', 'marks']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.students)
-                print(f"💾 Data saved successfully to {self.filename}")
+                    # Plain rows via itemgetter skip DictWriter's per-row key checks
+                    writer = csv.writer(file)
+                    writer.writerow(FIELDNAMES)
+                    writer.writerows(map(itemgetter(*FIELDNAMES), self.students))
+            os.replace(temp_filename, self.filename)
+            self._header_matches = True
+            print(f"💾 Data saved successfully to {self.filename}")
+        except Exception as e:
+            print(f"❌ Error saving data: {e}")
+    
+    def append_records(self, students: List[Dict[str, str]]) -> None:
+        """Append new records to the data file in one write, or save it in full if rows can't be appended."""
+        try:
+            new_file = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+            if not new_file:
+                with open(self.filename, 'rb') as file:
+                    file.seek(-1, os.SEEK_END)
+                    ends_with_newline = file.read(1) == b'\n'
+                if not (self._header_matches and ends_with_newline):
+                    self.save_data()
+                    return
+            with open(self.filename, 'a', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                writer = csv.writer(file)
+                if new_file:
+                    writer.writerow(FIELDNAMES)
+                writer.writerows(map(itemgetter(*FIELDNAMES), students))
+            print(f"💾 Data saved successfully to {self.filename}")
         except Exception as e:
             print(f"❌ Error saving data: {e}")
     
     def validate_roll_number(self, roll_number: str) -> bool:
         """Check if roll number is unique."""
-        return not any(student['roll_number'] == roll_number for student in self.students)
+        return roll_number not in self._by_roll
     
     def validate_age(self, age_str: str) -> Optional[int]:
         """Validate and return age as integer."""
-        try:
-            age = int(age_str)
-            if age < 1 or age > 150:
-                raise ValueError("Age must be between 1 and 150")
-            return age
-        except ValueError:
-            return None
+        return validate_age(age_str)
     
     def validate_marks(self, marks_str: str) -> Optional[float]:
         """Validate and return marks as float."""
-        try:
-            marks = float(marks_str)
-            if marks < 0 or marks > 100:
-                raise ValueError("Marks must be between 0 and 100")
-            return marks
-        except ValueError:
-            return None
+        return validate_marks(marks_str)
     
     def validate_name(self, name: str) -> bool:
         """Validate student name."""
@@ -124,17 +333,43 @@ class StudentManagementSystem:
             break
         
         # Add the student
-        student = {
-            'roll_number': roll_number,
-            'name': name.title(),
-            'age': str(age),
-            'marks': str(marks)
-        }
-        
-        self.students.append(student)
-        self.save_data()
+        self.add_students_bulk([{'roll_number': roll_number, 'name': name, 'age': age, 'marks': marks}])
         print(f"\n✅ Student '{name}' added successfully!")
     
+    def add_students_bulk(self, records: Iterable[Dict]) -> List[Dict[str, str]]:
+        """Add the valid records whose roll numbers are free, save them in one write and return them."""
+        added = []
+        skipped = 0
+        try:
+            for record in records:
+                # A missing field reads as None and fails validation like a bad value
+                roll_number, name, age_str, marks_str = map(record.get, FIELDNAMES)
+                roll_number = '' if roll_number is None else str(roll_number).strip()
+                name = '' if name is None else str(name).strip()
+                age = self.validate_age(str(age_str))
+                marks = self.validate_marks(str(marks_str))
+                if (not roll_number or not self.validate_roll_number(roll_number)
+                        or not self.validate_name(name) or age is None or marks is None):
+                    skipped += 1
+                    continue
+                student = self.annotate_student({
+                    'roll_number': roll_number,
+                    'name': canonical_name(name),
+                    'age': str(age),
+                    'marks': str(marks)
+                })
+                self.students.append(student)
+                self._by_roll[roll_number] = student
+                added.append(student)
+        finally:
+            # Records added before an error are still indexed and saved
+            if added:
+                self.records_changed()
+                self.append_records(added)
+        if skipped:
+            print(f"⚠️ Skipped {skipped} invalid or duplicate record(s)")
+        return added
+    
     def view_all_students(self) -> None:
         """Display all student records in a formatted table."""
         print("\n" + "="*80)
@@ -146,57 +381,42 @@ class StudentManagementSystem:
             return
         
         # Sort options
-        print("\nSort options:")
-        print("1. By Roll Number")
-        print("2. By Name")
-        print("3. By Marks (Highest first)")
-        print("4. No sorting")
+        sys.stdout.write("\nSort options:\n1. By Roll Number\n2. By Name\n3. By Marks (Highest first)\n4. No sorting\n")
         
         while True:
             choice = input("\nChoose sorting option (1-4): ").strip()
             if choice == '1':
-                sorted_students = sorted(self.students, key=lambda x: x['roll_number'])
+                order = self.order_by('roll_number')
                 break
             elif choice == '2':
-                sorted_students = sorted(self.students, key=lambda x: x['name'].lower())
+                order = self.order_by('_name_lc')
                 break
             elif choice == '3':
-                sorted_students = sorted(self.students, key=lambda x: float(x['marks']), reverse=True)
+                order = self.order_by('_marks_f', reverse=True)
                 break
             elif choice == '4':
-                sorted_students = self.students
+                order = None
                 break
             else:
                 print("❌ Please enter a valid option (1-4)!")
                 continue
         
-        # Display table
-        print(f"\n{'Roll No':<10} {'Name':<20} {'Age':<5} {'Marks':<8} {'Grade':<5}")
-        print("-" * 50)
-        
-        for student in sorted_students:
-            marks = float(student['marks'])
-            grade = self.calculate_grade(marks)
-            print(f"{student['roll_number']:<10} {student['name']:<20} {student['age']:<5} {student['marks']:<8} {grade:<5}")
-        
-        print(f"\nTotal Students: {len(self.students)}")
+        # Display table, written out in one call rather than a print per row
+        lines = ["", _TABLE_HEADER, _TABLE_RULE]
+        students = self.students
+        sorted_students = students if order is None else map(students.__getitem__, order)
+        lines.extend(map(self.format_row, sorted_students))
+        lines.append(f"\nTotal Students: {len(self.students)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def format_row(self, student: Dict[str, str]) -> str:
+        """Format one student as a line of the student table."""
+        return _ROW_FMT(student['roll_number'], student['name'], student['age'], student['marks'],
+                        calculate_grade(student['_marks_f']))
     
     def calculate_grade(self, marks: float) -> str:
         """Calculate grade based on marks."""
-        if marks >= 90:
-            return 'A+'
-        elif marks >= 80:
-            return 'A'
-        elif marks >= 70:
-            return 'B+'
-        elif marks >= 60:
-            return 'B'
-        elif marks >= 50:
-            return 'C'
-        elif marks >= 40:
-            return 'D'
-        else:
-            return 'F'
+        return calculate_grade(marks)
     
     def search_student(self) -> None:
         """Search for a student by roll number or name."""
@@ -223,31 +443,47 @@ class StudentManagementSystem:
             print("❌ Search term cannot be empty!")
             return
         
-        found_students = []
-        
         if choice == '1':
             # Search by roll number
-            for student in self.students:
-                if student['roll_number'].lower() == search_term.lower():
-                    found_students.append(student)
+            search_term = search_term.lower()
+            found_students = [
+                student for student in self.students
+                if student['roll_number'].lower() == search_term
+            ]
         else:
             # Search by name (partial match)
-            for student in self.students:
-                if search_term.lower() in student['name'].lower():
-                    found_students.append(student)
+            found_students = self.find_by_name(search_term)
         
         if found_students:
-            print(f"\n🎯 Found {len(found_students)} student(s):")
-            print(f"{'Roll No':<10} {'Name':<20} {'Age':<5} {'Marks':<8} {'Grade':<5}")
-            print("-" * 50)
-            
-            for student in found_students:
-                marks = float(student['marks'])
-                grade = self.calculate_grade(marks)
-                print(f"{student['roll_number']:<10} {student['name']:<20} {student['age']:<5} {student['marks']:<8} {grade:<5}")
+            lines = [f"\n🎯 Found {len(found_students)} student(s):", _TABLE_HEADER, _TABLE_RULE]
+            lines.extend(map(self.format_row, found_students))
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"❌ No student found with the given {'roll number' if choice == '1' else 'name'}!")
     
+    def find_by_name(self, term: str) -> List[Dict[str, str]]:
+        """Return the records whose name contains term, ignoring case, in file order."""
+        # Terms of three or more characters go through a trigram index built on first use
+        term = term.lower()
+        students = self.students
+        if len(term) < 3:
+            return [student for student in students if term in student['_name_lc']]
+        
+        if self._trigrams is None:
+            self._trigrams = {}
+            for row, student in enumerate(students):
+                name = student['_name_lc']
+                for start in range(len(name) - 2):
+                    self._trigrams.setdefault(name[start:start + 3], set()).add(row)
+        
+        # Intersect from the rarest trigram up
+        postings = sorted(
+            (self._trigrams.get(term[start:start + 3], set()) for start in range(len(term) - 2)),
+            key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return [students[row] for row in sorted(candidates) if term in students[row]['_name_lc']]
+    
     def update_student(self) -> None:
         """Update an existing student record."""
         print("\n" + "="*50)
@@ -264,17 +500,11 @@ class StudentManagementSystem:
             return
         
         # Find the student
-        student_index = None
-        for i, student in enumerate(self.students):
-            if student['roll_number'] == roll_number:
-                student_index = i
-                break
-        
-        if student_index is None:
+        current_student = self._by_roll.get(roll_number)
+        if current_student is None:
             print(f"❌ No student found with roll number '{roll_number}'!")
             return
         
-        current_student = self.students[student_index]
         print(f"\n📋 Current details for Roll Number {roll_number}:")
         print(f"Name: {current_student['name']}")
         print(f"Age: {current_student['age']}")
@@ -303,7 +533,8 @@ class StudentManagementSystem:
                 if not self.validate_name(new_name):
                     print("❌ Name must be at least 2 characters long!")
                     continue
-                current_student['name'] = new_name.title()
+                current_student['name'] = canonical_name(new_name)
+                current_student['_name_lc'] = current_student['name'].lower()
                 updated = True
                 break
         
@@ -330,12 +561,14 @@ class StudentManagementSystem:
                     print("❌ Please enter valid marks (0-100)!")
                     continue
                 current_student['marks'] = str(marks)
+                current_student['_marks_f'] = marks
                 updated = True
                 break
         
         if updated:
-            self.save_data()
+            self.records_changed()
             print(f"\n✅ Student record updated successfully!")
+            print("💾 Changes will be saved on exit.")
         else:
             print("ℹ️ No changes were made.")
     
@@ -355,14 +588,7 @@ class StudentManagementSystem:
             return
         
         # Find the student
-        student_to_delete = None
-        student_index = None
-        for i, student in enumerate(self.students):
-            if student['roll_number'] == roll_number:
-                student_to_delete = student
-                student_index = i
-                break
-        
+        student_to_delete = self._by_roll.get(roll_number)
         if student_to_delete is None:
             print(f"❌ No student found with roll number '{roll_number}'!")
             return
@@ -377,9 +603,11 @@ class StudentManagementSystem:
         while True:
             confirm = input("\nConfirm deletion (y/n): ").strip().lower()
             if confirm in ['y', 'yes']:
-                del self.students[student_index]
-                self.save_data()
+                self.students.remove(student_to_delete)
+                del self._by_roll[roll_number]
+                self.records_changed()
                 print(f"\n✅ Student '{student_to_delete['name']}' deleted successfully!")
+                print("💾 Changes will be saved on exit.")
                 break
             elif confirm in ['n', 'no']:
                 print("ℹ️ Deletion cancelled.")
@@ -398,42 +626,32 @@ class StudentManagementSystem:
             return
         
         total_students = len(self.students)
-        marks_list = [float(student['marks']) for student in self.students]
+        # Packed float column; sum/max/min walk unboxed doubles
+        marks_list = self.column('_marks_f')
         
         avg_marks = sum(marks_list) / total_students
         highest_marks = max(marks_list)
         lowest_marks = min(marks_list)
         
-        # Grade distribution
-        grades = {'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for marks in marks_list:
-            grade = self.calculate_grade(marks)
-            grades[grade] += 1
-        
-        print(f"Total Students: {total_students}")
-        print(f"Average Marks: {avg_marks:.2f}")
-        print(f"Highest Marks: {highest_marks}")
-        print(f"Lowest Marks: {lowest_marks}")
+        # Grade distribution, bucketed in one pass and listed best grade first
+        grades = dict(zip(reversed(GRADE_LABELS), reversed(grade_histogram(marks_list))))
         
-        print(f"\n📈 Grade Distribution:")
+        lines = [
+            f"Total Students: {total_students}",
+            f"Average Marks: {avg_marks:.2f}",
+            f"Highest Marks: {highest_marks}",
+            f"Lowest Marks: {lowest_marks}",
+            f"\n📈 Grade Distribution:"
+        ]
         for grade, count in grades.items():
             if count > 0:
                 percentage = (count / total_students) * 100
-                print(f"{grade}: {count} students ({percentage:.1f}%)")
+                lines.append(f"{grade}: {count} students ({percentage:.1f}%)")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_menu(self) -> None:
         """Display the main menu."""
-        print("\n" + "="*60)
-        print("🎓 STUDENT MANAGEMENT SYSTEM")
-        print("="*60)
-        print("1. 📝 Add Student Record")
-        print("2. 👥 View All Records")
-        print("3. 🔍 Search Student Record")
-        print("4. ✏️ Update Student Record")
-        print("5. 🗑️ Delete Student Record")
-        print("6. 📊 System Statistics")
-        print("7. 💾 Save & Exit")
-        print("="*60)
+        sys.stdout.write(_MENU)
     
     def run(self) -> None:
         """Main program loop."""